@@ -11,26 +11,122 @@ It allows users to:
 """
 
 import os
-import pandas as pd
+import pathlib
+import functools
 import gradio as gr
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
 
+# pandas and pyarrow are imported lazily inside the handlers that need
+# them, so app startup doesn't pay their import cost
+
 # Import the core meeting assistant functionality
 from meeting_assistant import run_meeting_assistant, save_workflow_diagram, get_processed_files
 
-# Ensure directories exist
-os.makedirs("minutes", exist_ok=True)
-os.makedirs("output", exist_ok=True)
-os.makedirs("logs", exist_ok=True)
+# Ensure directories exist, skipping the mkdir when already present
+for _dir in ("minutes", "output", "logs"):
+    os.path.isdir(_dir) or os.makedirs(_dir)
+
+# Parquet mirrors of the append-only CSV logs. The CSVs stay the write
+# path (and double as a plain-text export); the UI reads the columnar
+# mirror so handlers can project just the columns they need.
+_PARQUET_MIRRORS = {
+    "output/contracts.csv": "output/contracts.parquet",
+    "logs/meeting_analytics.csv": "logs/meeting_analytics.parquet",
+}
+
+@functools.lru_cache(maxsize=1)
+def _csv_convert_options():
+    """Build ConvertOptions for Arrow's CSV parser on first use.
+
+    Arrow's multithreaded parser types the columns up front, so dates
+    and numerics land in the mirror already converted.
+    """
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+
+    return pacsv.ConvertOptions(
+        column_types={
+            "meeting_date": pa.timestamp("s"),
+            # Analytics timestamps are datetime.now().isoformat() and carry
+            # microseconds; a seconds-unit column would reject every value
+            "timestamp": pa.timestamp("us"),
+            "success": pa.bool_(),
+            "processing_time": pa.float32(),
+            "action_items_count": pa.int16(),
+        },
+        timestamp_parsers=[pacsv.ISO8601, "%Y%m%d", "%Y-%m-%d"],
+    )
+
+def _sync_parquet(csv_path):
+    """Refresh the Parquet mirror of a CSV when the CSV is newer.
+
+    Returns the mirror path, or None when the CSV doesn't exist yet.
+    """
+    parquet_path = _PARQUET_MIRRORS[csv_path]
+    try:
+        csv_mtime_ns = os.stat(csv_path).st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    try:
+        if os.stat(parquet_path).st_mtime_ns >= csv_mtime_ns:
+            return parquet_path
+    except FileNotFoundError:
+        pass
+
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    from pyarrow import parquet as pq
+
+    try:
+        table = pacsv.read_csv(csv_path, convert_options=_csv_convert_options())
+    except pa.ArrowInvalid:
+        # Fall back to pandas when a column can't be typed (e.g. "Unknown"
+        # placeholder dates written by the extraction error path), keeping
+        # the same narrow dtypes for the analytics columns
+        import pandas as pd
+        table = pa.Table.from_pandas(pd.read_csv(
+            csv_path,
+            dtype={
+                "success": "bool",
+                "action_items_count": "int16",
+                "processing_time": "float32",
+            },
+        ))
+    pq.write_table(table, parquet_path, compression="snappy")
+    return parquet_path
+
+@functools.lru_cache(maxsize=8)
+def _read_parquet_cached(path, mtime_ns, columns):
+    """Read a Parquet file, caching the DataFrame keyed by modification time."""
+    import pandas as pd
+
+    return pd.read_parquet(
+        path, engine="pyarrow", columns=list(columns) if columns else None
+    )
+
+def load_table(csv_path, columns=None):
+    """Load a CSV-backed table via its Parquet mirror, reusing the cached parse.
+
+    Only the requested columns are read from disk. Callers that mutate the
+    result should operate on a copy.
+    """
+    parquet_path = _sync_parquet(csv_path)
+    mtime_ns = os.stat(parquet_path).st_mtime_ns
+    return _read_parquet_cached(parquet_path, mtime_ns, columns)
+
+# One-time migration so existing CSV history is queryable as Parquet
+for _csv_path in _PARQUET_MIRRORS:
+    _sync_parquet(_csv_path)
 
 def process_meeting():
     """Process the most recent meeting transcript."""
     message, final_state = run_meeting_assistant()
     
     if final_state is None:
-        return message, "", "", ""
+        # The contracts output is a gr.Dataframe; an empty string would be
+        # treated as a CSV path, so return None to leave it blank
+        return message, "", None, ""
     
     # Format the results
     summary_with_actions = final_state["summary"]
@@ -39,79 +135,143 @@ def process_meeting():
         for item in final_state["action_items"]:
             summary_with_actions += f"- {item}\n"
     
-    # Read contracts CSV if it exists
-    contracts_html = "<p>No contracts data available yet.</p>"
+    # The pipeline flushes contracts.csv before returning, and load_table
+    # is mtime-cached, so reading it back here costs one stat on repeat
+    # views while staying consistent with multi-file batches
+    contracts_df = None
     if os.path.exists("output/contracts.csv"):
-        contracts_df = pd.read_csv("output/contracts.csv")
-        contracts_html = contracts_df.to_html(classes="table table-striped")
-    
+        contracts_df = load_table("output/contracts.csv")
+
     # Show client info
     client_info = f"Client: {final_state['client_name']}\nMeeting Date: {final_state['meeting_date']}"
-    
-    return summary_with_actions, final_state["email_content"], contracts_html, client_info
+
+    return summary_with_actions, final_state["email_content"], contracts_df, client_info
 
 def view_contracts():
-    """View the contracts CSV as a dataframe."""
+    """View the contracts data as a dataframe."""
     if os.path.exists("output/contracts.csv"):
-        contracts_df = pd.read_csv("output/contracts.csv")
-        return contracts_df.to_html(classes="table table-striped")
+        return load_table("output/contracts.csv")
     else:
-        return "<p>No contracts data available yet.</p>"
+        return None
+
+# Known meeting_date formats (filenames yield YYYYMMDD); the format that
+# works is cached so later conversions skip per-value inference
+_DATE_FORMATS = ("%Y%m%d", "%Y-%m-%d")
+_DATE_FMT_CACHE = {"fmt": None}
+
+def _parse_meeting_dates(series):
+    """Convert a date string column using an explicit, cached format."""
+    import pandas as pd
+
+    fmt = _DATE_FMT_CACHE["fmt"]
+    if fmt is not None:
+        return pd.to_datetime(series, format=fmt, errors="coerce")
+    for fmt in _DATE_FORMATS:
+        converted = pd.to_datetime(series, format=fmt, errors="coerce")
+        if not converted.isna().all():
+            _DATE_FMT_CACHE["fmt"] = fmt
+            return converted
+    # Unrecognized layout; let pandas infer as a last resort
+    return pd.to_datetime(series, errors="coerce")
 
 def analyze_contracts():
-    """Create visualizations of contract data."""
-    if not os.path.exists("output/contracts.csv"):
+    """Create visualizations of contract data, reusing cached results."""
+    try:
+        mtime_ns = os.stat("output/contracts.csv").st_mtime_ns
+    except FileNotFoundError:
         return "No contract data available yet."
-    
-    contracts_df = pd.read_csv("output/contracts.csv")
-    
+    return _analyze_contracts_impl(mtime_ns)
+
+@functools.lru_cache(maxsize=8)
+def _analyze_contracts_impl(mtime_ns):
+    """Build the contract analysis report for the file state at mtime_ns."""
+    import pandas as pd
+
+    # Work on a copy so the to_datetime conversion doesn't mutate the cache
+    contracts_df = load_table(
+        "output/contracts.csv",
+        columns=("client_name", "meeting_date", "project_scope"),
+    ).copy()
+
     if len(contracts_df) < 1:
         return "Not enough contract data for analysis."
     
-    # Convert meeting_date to datetime if it exists
-    if 'meeting_date' in contracts_df.columns:
-        contracts_df['meeting_date'] = pd.to_datetime(contracts_df['meeting_date'], errors='coerce')
-    
-    # Create a basic analysis report
-    report = ""
+    # Arrow already parsed meeting_date as a timestamp; convert only when the
+    # pandas fallback reader left it as strings
+    if 'meeting_date' in contracts_df.columns and not pd.api.types.is_datetime64_any_dtype(contracts_df['meeting_date']):
+        contracts_df['meeting_date'] = _parse_meeting_dates(contracts_df['meeting_date'])
     
+    # Collect report fragments and join once at the end, rather than
+    # reallocating the report string on every +=
+    parts = []
+
     # Count clients
     if 'client_name' in contracts_df.columns:
         client_counts = contracts_df['client_name'].value_counts()
-        report += f"### Client Activity\n"
-        for client, count in client_counts.items():
-            report += f"- {client}: {count} meetings\n"
-    
+        parts.append("### Client Activity\n")
+        # Build all the lines with vectorized string ops instead of a Python loop
+        client_lines = (
+            "- " + client_counts.index.astype(str) + ": "
+            + client_counts.astype(str) + " meetings"
+        )
+        parts.append("\n".join(client_lines) + "\n")
+
+    # Fuse the timeline and scope statistics into a single agg pass instead
+    # of separate full-column scans for each min/max/count/nunique
+    agg_spec = {}
+    if 'meeting_date' in contracts_df.columns:
+        agg_spec['meeting_date'] = ['min', 'max']
+    if 'project_scope' in contracts_df.columns:
+        agg_spec['project_scope'] = ['count', 'nunique']
+    stats = contracts_df.agg(agg_spec) if agg_spec else None
+
     # Timeline of meetings if dates are available
-    if 'meeting_date' in contracts_df.columns and not contracts_df['meeting_date'].isna().all():
-        report += f"\n### Timeline\n"
-        report += f"- First meeting: {contracts_df['meeting_date'].min().strftime('%Y-%m-%d')}\n"
-        report += f"- Last meeting: {contracts_df['meeting_date'].max().strftime('%Y-%m-%d')}\n"
-        report += f"- Total span: {(contracts_df['meeting_date'].max() - contracts_df['meeting_date'].min()).days} days\n"
-    
+    if 'meeting_date' in agg_spec and not contracts_df['meeting_date'].isna().all():
+        first_meeting = stats.loc['min', 'meeting_date']
+        last_meeting = stats.loc['max', 'meeting_date']
+        parts.append("\n### Timeline\n")
+        parts.append(f"- First meeting: {first_meeting.strftime('%Y-%m-%d')}\n")
+        parts.append(f"- Last meeting: {last_meeting.strftime('%Y-%m-%d')}\n")
+        parts.append(f"- Total span: {(last_meeting - first_meeting).days} days\n")
+
     # Project scope analysis
-    if 'project_scope' in contracts_df.columns:
-        report += f"\n### Project Scope Overview\n"
-        report += f"- Projects with defined scope: {contracts_df['project_scope'].count()}\n"
-        if contracts_df['project_scope'].nunique() > 0:
-            report += f"- Unique project types: {contracts_df['project_scope'].nunique()}\n"
-    
-    return report
+    if 'project_scope' in agg_spec:
+        scope_unique = int(stats.loc['nunique', 'project_scope'])
+        parts.append("\n### Project Scope Overview\n")
+        parts.append(f"- Projects with defined scope: {int(stats.loc['count', 'project_scope'])}\n")
+        if scope_unique > 0:
+            parts.append(f"- Unique project types: {scope_unique}\n")
+
+    return "".join(parts)
 
 def view_analytics():
-    """Create visualizations of analytics data."""
-    analytics_file = "logs/meeting_analytics.csv"
-    
-    if not os.path.exists(analytics_file):
+    """Create visualizations of analytics data, reusing cached results."""
+    try:
+        mtime_ns = os.stat("logs/meeting_analytics.csv").st_mtime_ns
+    except FileNotFoundError:
         return "No analytics data available yet."
-    
-    analytics_df = pd.read_csv(analytics_file)
-    
+    return _view_analytics_impl(mtime_ns)
+
+@functools.lru_cache(maxsize=8)
+def _view_analytics_impl(mtime_ns):
+    """Build the analytics summary report for the file state at mtime_ns."""
+    import pandas as pd
+
+    # Work on a copy so the timestamp conversion doesn't mutate the cache
+    analytics_df = load_table(
+        "logs/meeting_analytics.csv",
+        columns=(
+            "timestamp", "success", "processing_time",
+            "action_items_count", "client_name",
+        ),
+    ).copy()
+
     if len(analytics_df) < 1:
         return "Not enough analytics data for visualization."
     
-    # Convert timestamp to datetime
-    analytics_df['timestamp'] = pd.to_datetime(analytics_df['timestamp'])
+    # Arrow already parsed timestamp; convert only on the pandas fallback path
+    if not pd.api.types.is_datetime64_any_dtype(analytics_df['timestamp']):
+        analytics_df['timestamp'] = pd.to_datetime(analytics_df['timestamp'])
     
     # Calculate some stats
     total_meetings = len(analytics_df)
@@ -119,49 +279,72 @@ def view_analytics():
     avg_processing_time = analytics_df['processing_time'].mean()
     avg_action_items = analytics_df['action_items_count'].mean()
     
-    report = f"""
+    # Collect report fragments and join once at the end
+    parts = [f"""
     ## Analytics Summary
-    
+
     - Total meetings processed: {total_meetings}
     - Success rate: {success_rate:.1f}%
     - Average processing time: {avg_processing_time:.2f} seconds
     - Average action items per meeting: {avg_action_items:.1f}
-    
+
     ### Recent Activity
-    
-    """
-    
-    # Get recent entries
-    recent_df = analytics_df.sort_values('timestamp', ascending=False).head(5)
-    for _, row in recent_df.iterrows():
-        report += f"- {row['timestamp'].strftime('%Y-%m-%d %H:%M')}: {row['client_name']} ({row['processing_time']}s, {row['action_items_count']} actions)\n"
-    
-    return report
+
+    """]
+
+    # Get recent entries with a heap selection rather than a full sort,
+    # formatting with vectorized string ops (iterrows boxes every row
+    # into a Series)
+    recent_df = analytics_df.nlargest(5, "timestamp")
+    recent_lines = (
+        "- " + recent_df['timestamp'].dt.strftime('%Y-%m-%d %H:%M') + ": "
+        + recent_df['client_name'].astype(str)
+        + " (" + recent_df['processing_time'].astype(str) + "s, "
+        + recent_df['action_items_count'].astype(str) + " actions)"
+    )
+    parts.append(recent_lines.str.cat(sep="\n"))
+
+    return "".join(parts)
+
+@functools.lru_cache(maxsize=4)
+def _read_text_cached(path, mtime_ns):
+    """Read a text file once per on-disk version."""
+    return pathlib.Path(path).read_text(encoding="utf-8")
+
+# The workflow definition is static for the life of the process, so the
+# diagram only needs to be rendered once
+_DIAGRAM_CACHE = {"path": None}
 
 def create_workflow_diagram():
     """Generate and display the workflow diagram."""
     try:
-        # Generate the diagram
-        diagram_path = save_workflow_diagram()
-        
-        if diagram_path and os.path.exists(diagram_path):
-            if diagram_path.endswith('.png'):
-                # Return the path to be displayed as an image
-                return diagram_path, f"Workflow diagram saved to {diagram_path}"
-            elif diagram_path.endswith('.html'):
-                # Display the HTML content for the user
-                with open(diagram_path, 'r') as f:
-                    html_content = f.read()
-                return None, f"<p>Workflow diagram saved to {diagram_path}</p><p>You can open this file in a web browser to view the diagram.</p>"
-            elif diagram_path.endswith('.md'):
-                # Show a message about the Mermaid file
-                with open(diagram_path, 'r') as f:
-                    md_content = f.read()
-                return None, f"<p>Workflow diagram saved as Mermaid markdown to {diagram_path}</p><p>To view it, copy the content below and paste it into https://mermaid.live</p><pre>{md_content}</pre>"
-            else:
-                return None, f"Workflow diagram saved to {diagram_path}"
-        else:
+        # Reuse the previously generated diagram if it is still on disk
+        diagram_path = _DIAGRAM_CACHE["path"]
+        if not (diagram_path and os.path.exists(diagram_path)):
+            diagram_path = save_workflow_diagram()
+            _DIAGRAM_CACHE["path"] = diagram_path
+
+        if not diagram_path:
             return None, "Failed to generate workflow diagram"
+
+        # A single stat both confirms the file exists and keys the content cache
+        try:
+            st = os.stat(diagram_path)
+        except OSError:
+            return None, "Failed to generate workflow diagram"
+
+        if diagram_path.endswith('.png'):
+            # Return the path to be displayed as an image
+            return diagram_path, f"Workflow diagram saved to {diagram_path}"
+        elif diagram_path.endswith('.html'):
+            # No need to read the HTML here; the user opens it in a browser
+            return None, f"<p>Workflow diagram saved to {diagram_path}</p><p>You can open this file in a web browser to view the diagram.</p>"
+        elif diagram_path.endswith('.md'):
+            # Show the Mermaid source, reading it at most once per version
+            md_content = _read_text_cached(diagram_path, st.st_mtime_ns)
+            return None, f"<p>Workflow diagram saved as Mermaid markdown to {diagram_path}</p><p>To view it, copy the content below and paste it into https://mermaid.live</p><pre>{md_content}</pre>"
+        else:
+            return None, f"Workflow diagram saved to {diagram_path}"
     except Exception as e:
         return None, f"Error generating workflow diagram: {str(e)}"
 
@@ -172,18 +355,21 @@ def list_processed_files():
     if not processed_files:
         return "No files have been processed yet."
     
-    report = "## Processed Files\n\n"
-    for filename, timestamp in sorted(processed_files.items(), key=lambda x: x[1], reverse=True):
-        # Convert ISO timestamp to datetime for better formatting
+    # Parse each ISO timestamp once (the log is written with
+    # datetime.isoformat), sort on the datetime, then format. Entries
+    # whose timestamp won't parse (e.g. hand-edited legacy log content)
+    # keep the raw string and sort last instead of blanking the tab
+    parsed = []
+    for f, t in processed_files.items():
         try:
-            dt = datetime.fromisoformat(timestamp)
-            formatted_time = dt.strftime("%Y-%m-%d %H:%M:%S")
-        except:
-            formatted_time = timestamp
-            
-        report += f"- **{filename}**: {formatted_time}\n"
-    
-    return report
+            dt = datetime.fromisoformat(t)
+            parsed.append((f, dt, f"{dt:%Y-%m-%d %H:%M:%S}"))
+        except (TypeError, ValueError):
+            parsed.append((f, datetime.min, str(t)))
+    parsed.sort(key=lambda item: item[1], reverse=True)
+
+    body = "\n".join(f"- **{f}**: {shown}" for f, _dt, shown in parsed)
+    return "## Processed Files\n\n" + body + "\n"
 
 def create_gradio_app():
     """Create a Gradio app for the meeting assistant."""
@@ -197,7 +383,7 @@ def create_gradio_app():
             client_info = gr.Textbox(label="Client Information", lines=2)
             summary_output = gr.Textbox(label="Meeting Summary and Action Items", lines=10)
             email_output = gr.Textbox(label="Follow-up Email", lines=10)
-            contracts_output = gr.HTML(label="Contracts Data")
+            contracts_output = gr.Dataframe(label="Contracts Data", interactive=False, wrap=False)
             
             process_btn.click(
                 fn=process_meeting,
@@ -206,7 +392,7 @@ def create_gradio_app():
         
         with gr.Tab("View Contracts"):
             view_btn = gr.Button("View Contracts Database")
-            contracts_view = gr.HTML()
+            contracts_view = gr.Dataframe(interactive=False, wrap=False)
             
             view_btn.click(
                 fn=view_contracts,
@@ -12,36 +12,69 @@ The Gradio interface is defined in a separate file.
 
 # Standard library imports
 import os
+import re
 import csv
-import glob
+import operator
+import gzip
 import json
 import time
+import queue
+import atexit
+import shutil
+import asyncio
+import hashlib
 import logging
+import functools
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
 # Third-party imports
-import pandas as pd
+import orjson
 from dotenv import load_dotenv
 from pydantic import BaseModel
 
 # LangChain and LangGraph imports
 from langgraph.graph import StateGraph, END
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from langchain_core.output_parsers import StrOutputParser
-from langchain_ollama import ChatOllama
 from langchain.prompts import ChatPromptTemplate
 
-# Initialize logging
-os.makedirs("logs", exist_ok=True)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("logs/meeting_assistant.log"),
-        logging.StreamHandler()
-    ]
-)
+# Working directories are created once per process; the guard makes
+# repeat calls free
+_DIRS_READY = False
+
+def _ensure_dirs() -> None:
+    """Create the working directories once per process."""
+    global _DIRS_READY
+    if _DIRS_READY:
+        return
+    for directory in ("minutes", "output", "logs"):
+        os.makedirs(directory, exist_ok=True)
+    _DIRS_READY = True
+
+# Initialize logging. Records are enqueued on the hot path and drained
+# to the file and console handlers by a background thread, so pipeline
+# code never blocks on synchronous handler I/O under the logging lock.
+_ensure_dirs()
+
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_log_file_handler = logging.FileHandler("logs/meeting_assistant.log")
+_log_file_handler.setFormatter(_log_formatter)
+_log_stream_handler = logging.StreamHandler()
+_log_stream_handler.setFormatter(_log_formatter)
+
+# Attach the queue handler directly rather than via basicConfig, which
+# would give it a default formatter and bake a pre-formatted string into
+# each record before the listener's handlers format it again
+_log_queue: queue.Queue = queue.Queue(-1)
+_root_logger = logging.getLogger()
+_root_logger.setLevel(logging.INFO)
+_root_logger.addHandler(QueueHandler(_log_queue))
+
+_log_listener = QueueListener(_log_queue, _log_file_handler, _log_stream_handler)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 # Load environment variables
 load_dotenv()
@@ -49,22 +82,116 @@ load_dotenv()
 # Get model settings from environment variables or use defaults
 LLM_MODEL = "gemma3:27b"
 
-# Initialize LLM
-llm = ChatOllama(
-    model=LLM_MODEL,
-    temperature=0, 
-    timeout=240 
-)
+# Cap how much of a transcript is read: ~50k tokens, comfortably within
+# the gemma3 context window, so an oversize file can't blow the prompt
+MAX_TRANSCRIPT_BYTES = 200_000
 
-llm_json = ChatOllama(
-    model=LLM_MODEL,
-    temperature=0,
-    timeout=240,
-    format="json"
-)
+# Transcript filenames look like <client>_<YYYYMMDD>.txt; anchoring on
+# the date suffix keeps client names containing underscores intact
+_FILENAME_RE = re.compile(r"^(?P<client>.+)_(?P<date>\d{8})(?:\.txt)?$")
+
+# LLM clients are built lazily so CLI paths that never call the model
+# (e.g. run.py --diagram) skip the langchain-ollama import and client setup.
+# All outputs here are short (summary, action items, contract JSON), so
+# decoding is capped at 800 tokens to bound worst-case latency, and
+# top_k=1 with mirostat off makes temperature-0 decoding strictly greedy.
+MAX_OUTPUT_TOKENS = 800
+
+@functools.lru_cache(maxsize=1)
+def get_llm() -> Any:
+    """Get the shared chat model, constructing it on first use."""
+    from langchain_ollama import ChatOllama
+    return ChatOllama(
+        model=LLM_MODEL,
+        temperature=0,
+        timeout=240,
+        num_predict=MAX_OUTPUT_TOKENS,
+        mirostat=0,
+        top_k=1
+    )
+
+@functools.lru_cache(maxsize=1)
+def get_llm_json() -> Any:
+    """Get the shared JSON-mode chat model, constructing it on first use."""
+    from langchain_ollama import ChatOllama
+    return ChatOllama(
+        model=LLM_MODEL,
+        temperature=0,
+        timeout=240,
+        num_predict=MAX_OUTPUT_TOKENS,
+        mirostat=0,
+        top_k=1,
+        format="json"
+    )
 
 output_parser = StrOutputParser()
 
+# Stable prompt prefix: keeping the header and transcript byte-identical
+# across calls lets Ollama reuse its prefix KV cache, skipping the
+# transcript prefill on repeat requests. Task-specific instructions go
+# after the TASK marker.
+TRANSCRIPT_PREFIX_TEMPLATE = "You are a meeting analyst.\n\nTRANSCRIPT:\n{transcript}\n\n---\nTASK:\n"
+
+ANALYZE_TASK_TEMPLATE = """Analyze the meeting transcript above and respond with JSON matching this schema exactly:
+{{"summary": string, "action_items": string[], "contract_data": {{"client_name": string, "project_scope": string, "budget": string, "timeline": string, "main_contact": string, "follow_up_date": string, "special_requirements": string}}}}
+
+summary is a concise summary of the discussion and action_items lists the actionable items, one string each.
+
+Meeting with: {client}
+Date: {date}
+
+Respond with valid JSON only, using exactly those keys."""
+
+# The follow-up email is a mechanical interpolation of values the
+# pipeline already has, so it is templated instead of generated
+EMAIL_TEMPLATE = """Subject: Follow-up on our {date} meeting
+
+Dear {client} team,
+
+Thank you for meeting with us on {date}. Here is a brief recap of the discussion:
+
+{summary}
+
+Next steps:
+{actions}
+
+Please let us know if we missed anything. We look forward to continuing the work together.
+
+Best regards"""
+
+# Version tag for the analysis prompt; bump it to invalidate cached
+# responses whenever the prompt wording changes
+PROMPT_TEMPLATE_VERSION = "analyze-v3"
+
+LLM_CACHE_DIR = "logs/llm_cache"
+
+def _llm_cache_path(prompt_content: str) -> str:
+    """Build the cache file path for a fully rendered prompt."""
+    key = hashlib.sha256(
+        f"{LLM_MODEL}|{PROMPT_TEMPLATE_VERSION}|{prompt_content}".encode()
+    ).hexdigest()
+    return os.path.join(LLM_CACHE_DIR, f"{key}.json")
+
+def _llm_cache_get(prompt_content: str) -> Optional[str]:
+    """Look up a cached LLM response for a prompt, or None on a miss."""
+    try:
+        path = _llm_cache_path(prompt_content)
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                return orjson.loads(f.read())["response"]
+    except Exception as e:
+        logging.warning(f"Error reading LLM response cache: {str(e)}")
+    return None
+
+def _llm_cache_put(prompt_content: str, response: str) -> None:
+    """Store an LLM response in the on-disk cache."""
+    try:
+        os.makedirs(LLM_CACHE_DIR, exist_ok=True)
+        with open(_llm_cache_path(prompt_content), 'wb') as f:
+            f.write(orjson.dumps({"response": response}))
+    except Exception as e:
+        logging.warning(f"Error writing LLM response cache: {str(e)}")
+
 #------------------------------------------------------------------------------
 # Data Models
 #------------------------------------------------------------------------------
@@ -78,6 +205,13 @@ class MeetingAssistantState(Dict):
     contract_data: Dict[str, Any]
     client_name: str
     meeting_date: str
+    # LangGraph builds its state channels from these annotations, so
+    # every key the batch loop feeds into the graph must be declared here
+    # or it is silently dropped before the first node runs
+    selected_transcript: Optional[tuple]
+    current_file: str
+    content_hash: str
+    duplicate_of: Optional[Dict[str, Any]]
 
 
 class ContractDataModel(BaseModel):
@@ -91,28 +225,54 @@ class ContractDataModel(BaseModel):
     special_requirements: str
 
 
+# Rotate the analytics log once it grows past this size, keeping
+# steady-state I/O per run bounded
+MAX_ANALYTICS_LOG_BYTES = 10 * 1024 * 1024
+
+
 class MeetingAnalytics:
     """Analytics for the Meeting Assistant."""
-    
+
     def __init__(self, log_file: str = "logs/meeting_analytics.csv") -> None:
         """Initialize the analytics tracker.
-        
+
         Args:
             log_file: Path to the CSV file for storing analytics data.
         """
         self.log_file = log_file
         self.current_session: Dict[str, Any] = {}
-        
+
+        # Rotate away an oversized log before appending to it
+        self._rotate_if_oversized()
+
         # Create log file with headers if it doesn't exist
         if not os.path.exists(log_file):
             with open(log_file, 'w', newline='') as file:
                 writer = csv.writer(file)
                 writer.writerow([
-                    'timestamp', 'client_name', 'meeting_date', 
+                    'timestamp', 'client_name', 'meeting_date',
                     'transcript_length', 'summary_length', 'action_items_count',
                     'processing_time', 'success'
                 ])
-    
+
+        # Keep one line-buffered append handle for the life of the process
+        # instead of paying an open/close per session
+        self._fh = open(log_file, 'a', newline='', buffering=1)
+        self._writer = csv.writer(self._fh)
+
+    def _rotate_if_oversized(self) -> None:
+        """Gzip and rotate the analytics log once it grows past the cap."""
+        try:
+            if os.path.exists(self.log_file) and os.path.getsize(self.log_file) > MAX_ANALYTICS_LOG_BYTES:
+                stamp = datetime.now().strftime("%Y%m%d%H%M%S")
+                rotated = f"{self.log_file}.{stamp}.gz"
+                with open(self.log_file, 'rb') as src, gzip.open(rotated, 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+                os.remove(self.log_file)
+                logging.info(f"Rotated analytics log to {rotated}")
+        except Exception as e:
+            logging.error(f"Error rotating analytics log: {str(e)}")
+
     def start_session(self, client_name: str, meeting_date: str) -> None:
         """Start tracking a processing session.
         
@@ -151,19 +311,18 @@ class MeetingAnalytics:
             'success': success
         })
         
-        # Log to file
-        with open(self.log_file, 'a', newline='') as file:
-            writer = csv.writer(file)
-            writer.writerow([
-                self.current_session['timestamp'],
-                self.current_session['client_name'],
-                self.current_session['meeting_date'],
-                self.current_session['transcript_length'],
-                self.current_session['summary_length'],
-                self.current_session['action_items_count'],
-                self.current_session['processing_time'],
-                self.current_session['success']
-            ])
+        # Log to file through the persistent handle
+        self._writer.writerow([
+            self.current_session['timestamp'],
+            self.current_session['client_name'],
+            self.current_session['meeting_date'],
+            self.current_session['transcript_length'],
+            self.current_session['summary_length'],
+            self.current_session['action_items_count'],
+            self.current_session['processing_time'],
+            self.current_session['success']
+        ])
+        self._fh.flush()
         
         logging.info(f"Completed processing in {processing_time:.2f}s with success={success}")
         
@@ -179,50 +338,122 @@ class MeetingAnalytics:
 #------------------------------------------------------------------------------
 # Tracking Processed Files
 #------------------------------------------------------------------------------
-def get_processed_files() -> dict:
-    """Get a dictionary of already processed files and their timestamps.
-    
+# The processed-file log is loaded into memory once and appended to as
+# NDJSON (one record per line), so marking a file is O(1) instead of
+# rewriting the whole JSON document every time
+PROCESSED_LOG_FILE = "logs/processed_files.ndjson"
+LEGACY_PROCESSED_LOG_FILE = "logs/processed_files.json"
+
+def _load_processed_files() -> dict:
+    """Load the processed-files log from disk into a dictionary.
+
+    Entries from the legacy JSON log are included so existing history
+    is preserved.
+
     Returns:
         Dictionary mapping filenames to processing timestamps
     """
-    processed_log_file = "logs/processed_files.json"
+    processed = {}
     try:
-        if os.path.exists(processed_log_file):
-            with open(processed_log_file, 'r') as f:
-                return json.load(f)
-        else:
-            return {}
+        if os.path.exists(LEGACY_PROCESSED_LOG_FILE):
+            with open(LEGACY_PROCESSED_LOG_FILE, 'rb') as f:
+                processed.update(orjson.loads(f.read()))
+        if os.path.exists(PROCESSED_LOG_FILE):
+            with open(PROCESSED_LOG_FILE, 'rb') as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        record = orjson.loads(line)
+                        processed[record["f"]] = record["t"]
     except Exception as e:
         logging.error(f"Error reading processed files log: {str(e)}")
-        return {}
+    return processed
+
+_PROCESSED = _load_processed_files()
+
+def get_processed_files() -> dict:
+    """Get a dictionary of already processed files and their timestamps.
+
+    Returns:
+        Dictionary mapping filenames to processing timestamps
+    """
+    return _PROCESSED
 
 def mark_file_as_processed(filename: str, timestamp: str) -> None:
-    """Mark a file as processed by recording it in the processed files log.
-    
+    """Mark a file as processed by appending it to the processed files log.
+
     Args:
         filename: The name of the processed file
         timestamp: When the file was processed
     """
-    processed_log_file = "logs/processed_files.json"
     try:
-        # Ensure logs directory exists
-        os.makedirs("logs", exist_ok=True)
-        
-        # Read existing log
-        processed_files = get_processed_files()
-        
-        # Add new entry
-        processed_files[filename] = timestamp
-        
-        # Write updated log
-        with open(processed_log_file, 'w') as f:
-            json.dump(processed_files, f, indent=2)
-            
+        # Append one NDJSON record and update the in-memory dictionary
+        with open(PROCESSED_LOG_FILE, 'ab') as f:
+            f.write(orjson.dumps({"f": filename, "t": timestamp}) + b"\n")
+        _PROCESSED[filename] = timestamp
+
         logging.info(f"Marked file as processed: {filename}")
     except Exception as e:
         logging.error(f"Error updating processed files log: {str(e)}")
 
 
+# Content-hash index of processed transcripts, used to skip the whole
+# LLM pipeline when a renamed file carries identical content
+CONTENT_HASHES_FILE = "logs/content_hashes.json"
+
+def _load_content_hashes() -> dict:
+    """Load the transcript content-hash index from disk.
+
+    Returns:
+        Dictionary mapping content hashes to the filename and metadata
+        of the transcript that produced them.
+    """
+    try:
+        if os.path.exists(CONTENT_HASHES_FILE):
+            with open(CONTENT_HASHES_FILE, 'rb') as f:
+                return orjson.loads(f.read())
+    except Exception as e:
+        logging.error(f"Error reading content hash index: {str(e)}")
+    return {}
+
+_CONTENT_HASHES = _load_content_hashes()
+
+def _record_content_hash(content_hash: str, filename: str, client_name: str, meeting_date: str) -> None:
+    """Record the content hash of a processed transcript.
+
+    Args:
+        content_hash: SHA256 hex digest of the transcript content.
+        filename: The transcript filename.
+        client_name: Client extracted for the meeting.
+        meeting_date: Date extracted for the meeting.
+    """
+    try:
+        _CONTENT_HASHES[content_hash] = {
+            "filename": filename,
+            "client_name": client_name,
+            "meeting_date": meeting_date
+        }
+        with open(CONTENT_HASHES_FILE, 'wb') as f:
+            f.write(orjson.dumps(_CONTENT_HASHES))
+    except Exception as e:
+        logging.error(f"Error updating content hash index: {str(e)}")
+
+def _copy_duplicate_outputs(previous: Dict[str, Any], client_name: str, meeting_date: str) -> None:
+    """Reuse the outputs of a content-identical transcript under new names.
+
+    Args:
+        previous: Recorded metadata of the original transcript.
+        client_name: Client name for the duplicate transcript.
+        meeting_date: Meeting date for the duplicate transcript.
+    """
+    for suffix in ("summary", "email"):
+        src = f"output/{previous['client_name']}_{previous['meeting_date']}_{suffix}.txt"
+        dst = f"output/{client_name}_{meeting_date}_{suffix}.txt"
+        if os.path.exists(src) and src != dst:
+            shutil.copyfile(src, dst)
+            logging.info(f"Reused {src} for duplicate transcript as {dst}")
+
+
 #------------------------------------------------------------------------------
 # Core Pipeline Functions
 #------------------------------------------------------------------------------
@@ -244,58 +475,94 @@ def initialize_state() -> MeetingAssistantState:
     }
 
 
+def _list_new_transcripts() -> tuple[bool, List[tuple]]:
+    """Scan the minutes folder for transcripts that haven't been processed.
+
+    Uses a single scandir pass; DirEntry.stat() reuses data from the
+    directory read, so each file costs one syscall instead of repeated
+    stat calls.
+
+    Returns:
+        Tuple of (whether any transcript files exist, list of
+        (name, path, mtime, size) entries for unprocessed files, sorted
+        oldest first).
+    """
+    processed_files = get_processed_files()
+    found_any = False
+    new_entries = []
+    try:
+        with os.scandir("minutes") as it:
+            for entry in it:
+                if not (entry.name.endswith(".txt") and entry.is_file()):
+                    continue
+                found_any = True
+                if entry.name not in processed_files:
+                    st = entry.stat()
+                    new_entries.append((entry.name, entry.path, st.st_mtime, st.st_size))
+    except FileNotFoundError:
+        pass
+
+    # Sort on the mtime captured during the scan; no further stat calls
+    new_entries.sort(key=operator.itemgetter(2))
+    return found_any, new_entries
+
+
 def read_transcript(state: MeetingAssistantState) -> MeetingAssistantState:
     """Read meeting transcript from files in minutes subfolder.
-    
-    Only processes files that haven't been processed before.
-    
+
+    Reads the transcript selected in the state, or the most recent
+    unprocessed file when none has been selected.
+
     Args:
         state: The current state dictionary.
-        
+
     Returns:
         Updated state with transcript and metadata.
     """
-    transcript_files = glob.glob("minutes/*.txt")
-    
-    if not transcript_files:
-        state["transcript"] = "No transcript files found."
-        logging.warning("No transcript files found in minutes directory")
-        return state
-    
-    # Get the list of already processed files
-    processed_files = get_processed_files()
-    
-    # Filter out already processed files
-    new_files = []
-    for file_path in transcript_files:
-        filename = os.path.basename(file_path)
-        if filename not in processed_files:
-            new_files.append(file_path)
-    
-    if not new_files:
-        state["transcript"] = "No new transcript files to process."
-        logging.info("All transcript files have already been processed")
-        return state
-    
-    # Get the most recent new file by modification time
-    latest_file = max(new_files, key=os.path.getmtime)
-    filename = os.path.basename(latest_file)
+    entry = state.get("selected_transcript")
+    if entry is None:
+        found_any, new_entries = _list_new_transcripts()
+
+        if not found_any:
+            state["transcript"] = "No transcript files found."
+            logging.warning("No transcript files found in minutes directory")
+            return state
+
+        if not new_entries:
+            state["transcript"] = "No new transcript files to process."
+            logging.info("All transcript files have already been processed")
+            return state
+
+        # Default to the most recent new file
+        entry = new_entries[-1]
+
+    filename, latest_file, _mtime, file_size = entry
     
     try:
+        # Read at most the context-window budget instead of the whole file
         with open(latest_file, 'r') as file:
-            state["transcript"] = file.read()
-        
-        # Log file info
-        file_size = os.path.getsize(latest_file)
+            raw_transcript = file.read(MAX_TRANSCRIPT_BYTES)
+
+        if file_size > MAX_TRANSCRIPT_BYTES:
+            logging.warning(
+                f"Transcript {filename} is {file_size} bytes; truncated to "
+                f"{MAX_TRANSCRIPT_BYTES} bytes to fit the model context"
+            )
+
+        # Canonicalize whitespace (normalized newlines, no trailing spaces)
+        # so prompts built from the transcript are byte-for-byte stable
+        state["transcript"] = "\n".join(
+            line.rstrip() for line in raw_transcript.splitlines()
+        ).strip()
+
+        # Log file info using the size captured during the scan
         logging.info(f"Read transcript file: {latest_file} ({file_size} bytes)")
         
-        # Extract filename parts for metadata
-        filename_parts = os.path.splitext(filename)[0].split('_')
-        
         # Try to extract client name and date from filename
-        if len(filename_parts) >= 2:
-            state["client_name"] = filename_parts[0]
-            state["meeting_date"] = filename_parts[1]
+        match = _FILENAME_RE.match(filename)
+        if match:
+            state["client_name"] = match["client"]
+            state["meeting_date"] = match["date"]
             logging.info(f"Extracted metadata - Client: {state['client_name']}, Date: {state['meeting_date']}")
         else:
             logging.warning(f"Couldn't extract proper metadata from filename: {filename}")
@@ -304,7 +571,16 @@ def read_transcript(state: MeetingAssistantState) -> MeetingAssistantState:
         
         # Store the current file being processed in the state
         state["current_file"] = filename
-        
+
+        # Flag transcripts whose content was already processed under a
+        # different filename, so the caller can skip the pipeline
+        content_hash = hashlib.sha256(state["transcript"].encode()).hexdigest()
+        state["content_hash"] = content_hash
+        previous = _CONTENT_HASHES.get(content_hash)
+        if previous is not None and previous.get("filename") != filename:
+            state["duplicate_of"] = previous
+
+
     except Exception as e:
         logging.error(f"Error reading transcript file {latest_file}: {str(e)}")
         state["transcript"] = f"Error reading file: {str(e)}"
@@ -312,132 +588,84 @@ def read_transcript(state: MeetingAssistantState) -> MeetingAssistantState:
     return state
 
 
-def summarize_meeting(state: MeetingAssistantState) -> MeetingAssistantState:
-    """Summarize the meeting transcript and generate action items.
-    
+async def analyze_meeting(state: MeetingAssistantState) -> MeetingAssistantState:
+    """Analyze the meeting transcript with a single LLM call.
+
+    Produces the summary, action items, follow-up email, and contract data
+    in one pass so the transcript is only sent to the model once.
+
     Args:
         state: The current state dictionary with transcript.
-        
+
     Returns:
-        Updated state with summary and action items.
+        Updated state with summary, action items, email content, and
+        contract data.
     """
     if not state["transcript"] or state["transcript"] == "No transcript files found.":
         state["summary"] = "No transcript available to summarize."
-        logging.warning("No transcript available to summarize")
-        return state
-    
-    logging.info(f"Summarizing meeting transcript ({len(state['transcript'])} chars)")
-    start_time = time.time()
-    
-    try:
-        # Create prompt for summarization
-        summarize_prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="You are an expert meeting assistant. Summarize the following meeting transcript into a concise summary and list of actionable items."),
-            HumanMessage(content=f"Here is the meeting transcript:\n\n{state['transcript']}\n\nPlease provide a summary of the discussion and a list of action items.")
-        ])
-        
-        # Create the chain
-        summarize_chain = summarize_prompt | llm | output_parser
-        
-        # Run the chain
-        result = summarize_chain.invoke({"transcript": state["transcript"]})
-        
-        # Parse the result to extract summary and action items
-        parts = result.split("Action Items:")
-        
-        if len(parts) > 1:
-            state["summary"] = parts[0].strip()
-            action_text = parts[1].strip()
-            state["action_items"] = [item.strip().strip('- ') for item in action_text.split('\n') if item.strip()]
-            logging.info(f"Extracted {len(state['action_items'])} action items")
-        else:
-            state["summary"] = result.strip()
-            state["action_items"] = []
-            logging.warning("No action items found in summary")
-        
-        # Log performance
-        processing_time = time.time() - start_time
-        logging.info(f"Summarization completed in {processing_time:.2f}s")
-        logging.debug(f"Summary length: {len(state['summary'])} chars")
-        
-    except Exception as e:
-        logging.error(f"Error summarizing meeting: {str(e)}")
-        state["summary"] = "Error generating summary."
         state["action_items"] = []
-    
-    return state
+        state["email_content"] = ""
+        state["contract_data"] = {}
+        logging.warning("No transcript available to analyze")
+        return state
 
+    logging.info(f"Analyzing meeting transcript ({len(state['transcript'])} chars)")
+    start_time = time.time()
 
-def generate_email(state: MeetingAssistantState) -> MeetingAssistantState:
-    """Generate a follow-up email based on meeting summary and action items.
-    
-    Args:
-        state: The current state dictionary with summary and action items.
-        
-    Returns:
-        Updated state with email content.
-    """
     try:
-        summary = state["summary"]
-        actions = "\n".join([f"- {a}" for a in state["action_items"]])
-        prompt = f"""
-You are an expert at writing professional follow-up emails.
-
-Meeting with: {state['client_name']}
-Date: {state['meeting_date']}
-
-Summary:
-{summary}
-
-Action Items:
-{actions}
+        # Create prompt covering all the outputs in one structured response,
+        # with the cache-friendly shared prefix ahead of the task text
+        prompt_content = (
+            TRANSCRIPT_PREFIX_TEMPLATE.format(transcript=state["transcript"])
+            + ANALYZE_TASK_TEMPLATE.format(
+                client=state["client_name"], date=state["meeting_date"]
+            )
+        )
 
-Write a concise and professional follow-up email summarizing key points and next steps.
-"""
-        response = llm.invoke([HumanMessage(content=prompt)])
-        state["email_content"] = output_parser.invoke(response)
-    except Exception as e:
-        logging.exception("Error generating email")
-        state["email_content"] = "Error generating follow-up email."
-    return state
+        # Reuse a cached response for an identical prompt (same model,
+        # template version, and transcript) before paying for an LLM call
+        json_result = _llm_cache_get(prompt_content)
+        if json_result is None:
+            analyze_prompt = ChatPromptTemplate.from_messages([
+                HumanMessage(content=prompt_content)
+            ])
 
+            # Create and run the combined analysis chain without blocking the
+            # event loop, so other graph branches can proceed
+            analyze_chain = analyze_prompt | get_llm_json() | output_parser
+            json_result = await analyze_chain.ainvoke({})
+            _llm_cache_put(prompt_content, json_result)
+        else:
+            logging.info("LLM response cache hit for analysis call")
 
-def extract_contract_data(state: MeetingAssistantState) -> MeetingAssistantState:
-    """Extract structured contract data from the meeting transcript.
+        # Try to parse the result as JSON
+        try:
+            analysis = json.loads(json_result)
+        except json.JSONDecodeError:
+            logging.warning("Couldn't parse JSON response from analysis call")
+            analysis = {}
 
-    Args:
-        state: The current state dictionary with transcript.
+        state["summary"] = analysis.get("summary", "Error generating summary.")
 
-    Returns:
-        Updated state with extracted contract data.
-    """
-    try:
-        # Define prompt for LLM to extract contract data in structured JSON format
-        prompt = ChatPromptTemplate.from_messages([
-            SystemMessage(content="""You are an expert at extracting contract information from meeting transcripts.
-Extract the following details in a structured JSON format:
-- client_name: The name of the client or company
-- project_scope: A brief description of the project scope
-- budget: The budget amount mentioned, if any
-- timeline: The project timeline or deadline
-- main_contact: The main point of contact at the client
-- follow_up_date: The date for follow-up, if mentioned
-- special_requirements: Any special requirements or considerations
-
-Format the response as valid JSON with these exact keys."""),
-            HumanMessage(content=f"Here is the meeting transcript:\n\n{state['transcript']}")
-        ])
+        # Tolerate the model returning the action items as a single block
+        action_items = analysis.get("action_items", [])
+        if isinstance(action_items, str):
+            action_items = [item.strip().strip('- ') for item in action_items.split('\n') if item.strip()]
+        state["action_items"] = action_items
 
-        # Create and run the extraction chain
-        extract_chain = prompt | llm_json | output_parser
-        json_result = extract_chain.invoke({})
+        # Build the follow-up email deterministically from the summary and
+        # action items; no model call needed for pure formatting
+        actions = "\n".join(f"- {a}" for a in state["action_items"]) or "- None recorded"
+        state["email_content"] = EMAIL_TEMPLATE.format(
+            client=state["client_name"],
+            date=state["meeting_date"],
+            summary=state["summary"],
+            actions=actions
+        )
 
-        # Try to parse the result as JSON
-        import json
-        try:
-            contract_data = json.loads(json_result)
-        except json.JSONDecodeError:
-            logging.warning("Couldn't parse JSON response, using fallback extraction")
+        contract_data = analysis.get("contract_data")
+        if not isinstance(contract_data, dict):
+            logging.warning("No contract data in analysis response, using fallback values")
             contract_data = {
                 "client_name": state.get("client_name", "Unknown"),
                 "project_scope": "Unknown",
@@ -452,8 +680,15 @@ Format the response as valid JSON with these exact keys."""),
         contract_data["meeting_date"] = state["meeting_date"]
         state["contract_data"] = contract_data
 
+        # Log performance
+        processing_time = time.time() - start_time
+        logging.info(f"Analysis completed in {processing_time:.2f}s with {len(state['action_items'])} action items")
+
     except Exception as e:
-        logging.exception("Error extracting contract data")
+        logging.exception("Error analyzing meeting")
+        state["summary"] = "Error generating summary."
+        state["action_items"] = []
+        state["email_content"] = "Error generating follow-up email."
         state["contract_data"] = {
             "client_name": state.get("client_name", "Unknown"),
             "project_scope": "Error in extraction",
@@ -468,58 +703,110 @@ Format the response as valid JSON with these exact keys."""),
     return state
 
 
-def update_contracts_csv(state: MeetingAssistantState) -> MeetingAssistantState:
+# Persistent contracts CSV writer, opened once per process and keyed on
+# the header columns so a schema change reopens the file cleanly
+CONTRACTS_CSV_FILE = "output/contracts.csv"
+_CONTRACTS_WRITER: Dict[str, Any] = {"fieldnames": None, "fh": None, "writer": None}
+
+def _get_contracts_writer(fieldnames: List[str]) -> Any:
+    """Get the persistent DictWriter for the contracts CSV.
+
+    Args:
+        fieldnames: Column names for the rows about to be written.
+
+    Returns:
+        A csv.DictWriter appending to the contracts CSV.
+    """
+    if _CONTRACTS_WRITER["writer"] is None or _CONTRACTS_WRITER["fieldnames"] != fieldnames:
+        if _CONTRACTS_WRITER["fh"] is not None:
+            _CONTRACTS_WRITER["fh"].close()
+
+        # Check if file exists to determine if we need to write headers
+        file_exists = os.path.isfile(CONTRACTS_CSV_FILE)
+
+        fh = open(CONTRACTS_CSV_FILE, mode='a', newline='', buffering=1)
+        writer = csv.DictWriter(fh, fieldnames=fieldnames)
+
+        # Write header if file is being created
+        if not file_exists:
+            writer.writeheader()
+            logging.info("Created new contracts CSV file")
+
+        _CONTRACTS_WRITER.update({"fieldnames": fieldnames, "fh": fh, "writer": writer})
+
+    return _CONTRACTS_WRITER["writer"]
+
+
+# Contract rows buffered during a pipeline run; the driver writes them
+# in one batched operation after the loop over transcripts
+_PENDING_CONTRACT_ROWS: List[Dict[str, Any]] = []
+
+def _flush_contract_rows() -> None:
+    """Write all buffered contract rows with batched writerows calls."""
+    if not _PENDING_CONTRACT_ROWS:
+        return
+    try:
+        batch: List[Dict[str, Any]] = []
+        fieldnames = None
+        for row in _PENDING_CONTRACT_ROWS:
+            row_fields = list(row.keys())
+            if row_fields != fieldnames:
+                if batch:
+                    _get_contracts_writer(fieldnames).writerows(batch)
+                    batch = []
+                fieldnames = row_fields
+            batch.append(row)
+        if batch:
+            _get_contracts_writer(fieldnames).writerows(batch)
+        _CONTRACTS_WRITER["fh"].flush()
+        logging.info(f"Wrote {len(_PENDING_CONTRACT_ROWS)} contract row(s) to CSV")
+    except Exception as e:
+        logging.error(f"Error writing buffered contract rows: {str(e)}")
+    finally:
+        _PENDING_CONTRACT_ROWS.clear()
+
+
+def update_contracts_csv(state: MeetingAssistantState) -> None:
     """Update or create a contracts CSV with the extracted data.
-    
+
+    Runs in parallel with save_outputs, so it writes no state keys.
+
     Args:
         state: The current state dictionary with contract data.
-        
+
     Returns:
-        Updated state (unchanged).
+        None (no state updates).
     """
     if not state["contract_data"] or "status" in state["contract_data"]:
         logging.warning("No valid contract data to update CSV")
-        return state
+        return None
     
     logging.info("Updating contracts CSV")
-    
+
     try:
-        csv_file = "output/contracts.csv"
         contract_data = state["contract_data"]
-        
-        # Check if file exists to determine if we need to write headers
-        file_exists = os.path.isfile(csv_file)
-        
-        with open(csv_file, mode='a', newline='') as file:
-            fieldnames = list(contract_data.keys())
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            
-            # Write header if file is being created
-            if not file_exists:
-                writer.writeheader()
-                logging.info("Created new contracts CSV file")
-            
-            # Write data row
-            writer.writerow(contract_data)
-            logging.info(f"Appended data for {contract_data.get('client_name', 'unknown client')} to CSV")
-        
+
+        # Buffer the row; the pipeline driver flushes the batch once per run
+        _PENDING_CONTRACT_ROWS.append(dict(contract_data))
+        logging.info(f"Buffered contract data for {contract_data.get('client_name', 'unknown client')}")
+
     except Exception as e:
         logging.error(f"Error updating contracts CSV: {str(e)}")
-    
-    return state
+
+    return None
 
 
-def save_outputs(state: MeetingAssistantState) -> MeetingAssistantState:
+def save_outputs(state: MeetingAssistantState) -> None:
     """Save the generated content to files.
-    
+
+    Runs in parallel with update_contracts_csv, so it writes no state keys.
+
     Args:
         state: The current state dictionary with all generated content.
-        
+
     Returns:
-        Updated state (unchanged).
+        None (no state updates).
     """
-    os.makedirs("output", exist_ok=True)
-    
     try:
         # Save summary
         if state["summary"]:
@@ -541,8 +828,8 @@ def save_outputs(state: MeetingAssistantState) -> MeetingAssistantState:
             
     except Exception as e:
         logging.error(f"Error saving outputs: {str(e)}")
-    
-    return state
+
+    return None
 
 #------------------------------------------------------------------------------
 # LangGraph Workflow
@@ -558,18 +845,16 @@ def create_meeting_assistant_graph() -> Any:
     
     # Add nodes
     workflow.add_node("read_transcript", read_transcript)
-    workflow.add_node("summarize_meeting", summarize_meeting)
-    workflow.add_node("generate_email", generate_email)
-    workflow.add_node("extract_contract_data", extract_contract_data)
+    workflow.add_node("analyze_meeting", analyze_meeting)
     workflow.add_node("update_contracts_csv", update_contracts_csv)
     workflow.add_node("save_outputs", save_outputs)
-    
-    # Set up the flow
-    workflow.add_edge("read_transcript", "summarize_meeting")
-    workflow.add_edge("summarize_meeting", "generate_email")
-    workflow.add_edge("generate_email", "extract_contract_data")
-    workflow.add_edge("extract_contract_data", "update_contracts_csv")
-    workflow.add_edge("update_contracts_csv", "save_outputs")
+
+    # Set up the flow; the two output nodes only read state, so they run
+    # as a parallel pair after the analysis
+    workflow.add_edge("read_transcript", "analyze_meeting")
+    workflow.add_edge("analyze_meeting", "update_contracts_csv")
+    workflow.add_edge("analyze_meeting", "save_outputs")
+    workflow.add_edge("update_contracts_csv", END)
     workflow.add_edge("save_outputs", END)
     
     # Set the entry point
@@ -578,17 +863,20 @@ def create_meeting_assistant_graph() -> Any:
     return workflow.compile()
 
 
+@functools.lru_cache(maxsize=1)
+def _get_compiled_graph() -> Any:
+    """Get the compiled workflow, building it once per process."""
+    return create_meeting_assistant_graph()
+
+
 def save_workflow_diagram() -> str:
     """Save a visualization of the Meeting Assistant workflow.
     
     Returns:
         Path to the saved workflow diagram file.
     """
-    # Ensure the output directory exists
-    os.makedirs("output", exist_ok=True)
-    
-    # We need to create a COMPILED workflow
-    workflow = create_meeting_assistant_graph()
+    # We need a COMPILED workflow; reuse the shared instance
+    workflow = _get_compiled_graph()
     
     # Try to use draw_png first
     output_path_png = "output/meeting_assistant_workflow.png"
@@ -669,63 +957,102 @@ def save_workflow_diagram() -> str:
 #------------------------------------------------------------------------------
 
 def run_meeting_assistant() -> tuple[str, Optional[Dict[str, Any]]]:
-    """Run the meeting assistant pipeline and track analytics.
-    
-    Only processes new files that haven't been processed before.
-    
+    """Run the meeting assistant pipeline over all new transcripts.
+
+    Processes every file that hasn't been processed before in a single
+    invocation, so Python startup and the Ollama model load are paid
+    once per batch instead of once per file.
+
     Returns:
-        Tuple containing (status message, final state)
+        Tuple containing (status message, final state of the last
+        processed meeting)
     """
-    os.makedirs("minutes", exist_ok=True)
-    os.makedirs("output", exist_ok=True)
-    os.makedirs("logs", exist_ok=True)
-    
     logging.info("Starting Meeting Assistant")
-    
-    # Initialize the graph
-    meeting_graph = create_meeting_assistant_graph()
-    
-    # Run the graph
-    state = initialize_state()
-    
-    try:
-        # Get initial transcript info to start analytics
-        transcript_state = read_transcript(state)
-        
-        if transcript_state["transcript"] == "No transcript files found.":
-            logging.warning("No meeting transcripts found")
-            return "No meeting transcripts found in the 'minutes' folder.", None
-        
-        if transcript_state["transcript"] == "No new transcript files to process.":
-            logging.info("No new files to process")
-            return "No new meeting transcripts to process.", None
-        
-        # Start analytics session
-        analytics.start_session(
-            transcript_state["client_name"],
-            transcript_state["meeting_date"]
-        )
-        
-        # Run the full graph
-        final_state = meeting_graph.invoke(state)
-        
-        # Mark the file as processed
-        if "current_file" in transcript_state:
-            mark_file_as_processed(
-                transcript_state["current_file"],
-                datetime.now().isoformat()
+
+    # Reuse the graph compiled once per process
+    meeting_graph = _get_compiled_graph()
+
+    found_any, new_entries = _list_new_transcripts()
+
+    if not found_any:
+        logging.warning("No meeting transcripts found")
+        return "No meeting transcripts found in the 'minutes' folder.", None
+
+    if not new_entries:
+        logging.info("No new files to process")
+        return "No new meeting transcripts to process.", None
+
+    processed_count = 0
+    final_state = None
+
+    # Process oldest first so contract history stays in chronological order
+    for entry in new_entries:
+        state = initialize_state()
+        state["selected_transcript"] = entry
+
+        try:
+            # Get transcript info to start analytics
+            transcript_state = read_transcript(state)
+
+            # A renamed file with identical content reuses the existing
+            # outputs instead of paying for the LLM pipeline again
+            duplicate = transcript_state.get("duplicate_of")
+            if duplicate is not None:
+                logging.info(
+                    f"Transcript {entry[0]} matches already-processed content "
+                    f"from {duplicate['filename']}; reusing its outputs"
+                )
+                _copy_duplicate_outputs(
+                    duplicate,
+                    transcript_state["client_name"],
+                    transcript_state["meeting_date"]
+                )
+                mark_file_as_processed(entry[0], datetime.now().isoformat())
+                processed_count += 1
+                continue
+
+            # Start analytics session
+            analytics.start_session(
+                transcript_state["client_name"],
+                transcript_state["meeting_date"]
             )
-        
-        # End analytics session with success
-        analytics.end_session(final_state, success=True)
-        
-        logging.info(f"Successfully processed meeting for {final_state['client_name']}")
-        return "Meeting processed successfully", final_state
-        
-    except Exception as e:
-        logging.error(f"Error processing meeting: {str(e)}")
-        analytics.end_session(state, success=False)
-        return f"Error processing meeting: {str(e)}", None
+
+            # Run the full graph on the event loop so the async nodes can
+            # overlap independent work
+            run_state = asyncio.run(meeting_graph.ainvoke(state))
+
+            # Mark the file as processed and remember its content hash
+            if "current_file" in transcript_state:
+                mark_file_as_processed(
+                    transcript_state["current_file"],
+                    datetime.now().isoformat()
+                )
+            if "content_hash" in transcript_state:
+                _record_content_hash(
+                    transcript_state["content_hash"],
+                    transcript_state.get("current_file", entry[0]),
+                    run_state["client_name"],
+                    run_state["meeting_date"]
+                )
+
+            # End analytics session with success
+            analytics.end_session(run_state, success=True)
+
+            final_state = run_state
+            processed_count += 1
+            logging.info(f"Successfully processed meeting for {run_state['client_name']}")
+
+        except Exception as e:
+            logging.error(f"Error processing meeting {entry[0]}: {str(e)}")
+            analytics.end_session(state, success=False)
+
+    # Write the batch of contract rows in one I/O operation
+    _flush_contract_rows()
+
+    if processed_count == 0:
+        return "Error processing meeting transcripts; see logs for details.", None
+
+    return f"Processed {processed_count} new meeting transcript(s)", final_state
 
 
 
@@ -737,7 +1064,5 @@ def run_meeting_assistant() -> tuple[str, Optional[Dict[str, Any]]]:
 analytics = MeetingAnalytics()
 
 if __name__ == "__main__":
-    # Just create necessary directories and exit
-    os.makedirs("minutes", exist_ok=True)
-    os.makedirs("output", exist_ok=True)
+    # Directories are created at import time; nothing else to do
     logging.info("Meeting Assistant core module ready")
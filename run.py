@@ -15,7 +15,6 @@ Usage:
 """
 
 import argparse
-import os
 import sys
 from rich.console import Console
 from rich.panel import Panel
@@ -28,11 +27,7 @@ console = Console()
 
 def main():
     """Parse arguments and launch the appropriate function"""
-    # Ensure directories exist
-    os.makedirs("minutes", exist_ok=True)
-    os.makedirs("output", exist_ok=True)
-    os.makedirs("logs", exist_ok=True)
-    
+    # Directories are created when meeting_assistant is imported
     parser = argparse.ArgumentParser(description="Meeting Assistant")
     group = parser.add_mutually_exclusive_group()
     group.add_argument("--web", action="store_true", help="Launch the web interface")
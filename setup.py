@@ -12,7 +12,9 @@ setup(
         "langchain-core>=0.1.0",
         "langgraph>=0.0.20",
         "langchain-ollama>=0.0.1",
+        "orjson>=3.9.0",
         "pandas>=2.0.0",
+        "pyarrow>=15.0.0",
         "gradio>=4.0.0",
         "plotly>=5.18.0",
         "python-dotenv>=1.0.0",